@@ -15,6 +15,7 @@ We support two flows:
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlencode
 
 import yaml
@@ -236,12 +237,12 @@ class EDAClient:
 
     def get(self, api_path: str, requires_auth: bool = True):
         url = f"{self.url}/{api_path}"
-        logger.debug(f"GET {url}")
+        logger.debug("GET %s", url)
         return self.http.request("GET", url, headers=self.get_headers(requires_auth))
 
-    def post(self, api_path: str, payload: dict, requires_auth: bool = True):
+    def post(self, api_path: str, payload: dict | list, requires_auth: bool = True):
         url = f"{self.url}/{api_path}"
-        logger.debug(f"POST {url}")
+        logger.debug("POST %s", url)
         body = json.dumps(payload).encode("utf-8")
         headers = self.get_headers(requires_auth)
         headers["Content-Type"] = "application/json"
@@ -249,7 +250,7 @@ class EDAClient:
 
     def patch(self, api_path: str, payload: str, requires_auth: bool = True):
         url = f"{self.url}/{api_path}"
-        logger.debug(f"PATCH {url}")
+        logger.debug("PATCH %s", url)
         body = payload.encode("utf-8")
         headers = self.get_headers(requires_auth)
         headers["Content-Type"] = "application/json"
@@ -289,7 +290,8 @@ class EDAClient:
     def add_to_transaction(self, cr_type: str, payload: dict) -> dict:
         item = {"type": {cr_type: payload}}
         self.transactions.append(item)
-        logger.debug(f"Adding item to transaction: {json.dumps(item, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Adding item to transaction: %s", json.dumps(item, indent=2))
         return item
 
     def add_create_to_transaction(self, resource_yaml: str) -> dict:
@@ -325,21 +327,19 @@ class EDAClient:
             },
         )
 
-    def is_transaction_item_valid(self, item: dict) -> bool:
-        logger.debug("Validating transaction item")
-
-        # Determine which validation endpoint to use based on the EDA version
+    def _api_major_version(self) -> int:
+        """Return the major component of the EDA version (e.g. 24 for 24.x)."""
         version = self.get_version()
-        logger.debug(f"EDA version for validation: {version}")
-
         if version.startswith("v"):
             version = version[1:]
-
         parts = version.split(".")
-        major = int(parts[0]) if parts[0].isdigit() else 0
+        return int(parts[0]) if parts[0].isdigit() else 0
+
+    def is_transaction_item_valid(self, item: dict) -> bool:
+        logger.debug("Validating transaction item")
 
         # v2 is the default. Only 24.x releases still use the v1 endpoint.
-        if major == MAJOR_V1_THRESHOLD:
+        if self._api_major_version() == MAJOR_V1_THRESHOLD:
             logger.debug("Using v1 transaction validation endpoint")
             resp = self.post("core/transaction/v1/validate", item)
         else:
@@ -354,6 +354,47 @@ class EDAClient:
         logger.warning(f"{SUBSTEP_INDENT}Validation error: {data}")
         return False
 
+    def validate_transaction_items(self, items: list[dict]) -> bool:
+        """
+        Validate several transaction items in one sweep.
+
+        The v2 validation endpoint accepts a list, so all items are posted
+        in a single request. The v1 endpoint (24.x releases) only takes one
+        item per request; there the calls are fanned out across a thread
+        pool instead, collapsing N serial round-trips into roughly the
+        latency of the slowest one.
+
+        Parameters
+        ----------
+        items : list[dict]
+            Transaction items as returned by add_to_transaction.
+
+        Returns
+        -------
+        bool
+            True if every item passed validation, False otherwise.
+        """
+        if not items:
+            return True
+        if len(items) == 1:
+            return self.is_transaction_item_valid(items[0])
+
+        if self._api_major_version() == MAJOR_V1_THRESHOLD:
+            logger.debug("Using v1 per-item validation across threads")
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(self.is_transaction_item_valid, items))
+            return all(results)
+
+        logger.debug(f"Validating {len(items)} transaction items in one request")
+        resp = self.post("core/transaction/v2/validate", items)
+        if resp.status == HTTP_NO_CONTENT:
+            logger.debug("Transaction items validation success.")
+            return True
+
+        data = json.loads(resp.data.decode("utf-8"))
+        logger.warning(f"{SUBSTEP_INDENT}Validation error: {data}")
+        return False
+
     def commit_transaction(
         self,
         description: str,
@@ -361,15 +402,7 @@ class EDAClient:
         result_type: str = "normal",
         retain: bool = True,
     ) -> str:
-        version = self.get_version()
-        logger.debug(f"EDA version for transaction: {version}")
-
-        if version.startswith("v"):
-            version = version[1:]
-
-        parts = version.split(".")
-        major = int(parts[0]) if parts[0].isdigit() else 0
-
+        major = self._api_major_version()
         payload = {
             "description": description,
             "dryrun": dryrun,
@@ -9,6 +9,11 @@ import urllib3
 
 logger = logging.getLogger(__name__)
 
+# Connections kept alive per host. urllib3's default of 1 means concurrent
+# requests (e.g. the transaction-validation fan-out) open extra TCP/TLS
+# connections and discard them instead of reusing them.
+POOL_MAXSIZE = 16
+
 
 def get_proxy_settings():
     """
@@ -99,6 +104,7 @@ def create_pool_manager(url=None, verify=True):
         return urllib3.PoolManager(
             cert_reqs="CERT_REQUIRED" if verify else "CERT_NONE",
             retries=urllib3.Retry(3),
+            maxsize=POOL_MAXSIZE,
         )
     proxy_url = https_proxy or http_proxy
     if proxy_url:
@@ -107,9 +113,11 @@ def create_pool_manager(url=None, verify=True):
             proxy_url,
             cert_reqs="CERT_REQUIRED" if verify else "CERT_NONE",
             retries=urllib3.Retry(3),
+            maxsize=POOL_MAXSIZE,
         )
     logger.debug("No proxy, returning direct PoolManager.")
     return urllib3.PoolManager(
         cert_reqs="CERT_REQUIRED" if verify else "CERT_NONE",
         retries=urllib3.Retry(3),
+        maxsize=POOL_MAXSIZE,
     )
@@ -7,8 +7,9 @@ import time
 import yaml
 
 import kubernetes as k8s
+import urllib3
 from clab_connector.utils.constants import SUBSTEP_INDENT
-from kubernetes import config
+from kubernetes import config, watch
 from kubernetes.client.rest import ApiException
 from kubernetes.stream import stream
 from kubernetes.utils import create_from_yaml
@@ -193,6 +194,93 @@ def apply_manifest(yaml_str: str, namespace: str = "eda-system") -> None:
         raise RuntimeError(f"Failed to apply manifest: {exc}") from exc
 
 
+def apply_manifests_batch(yaml_docs: list[str], namespace: str = "eda-system") -> None:
+    """
+    Apply several YAML manifests in one pass over a shared API client.
+
+    All documents are parsed up front (multi-document strings are supported),
+    then applied through a single CustomObjectsApi instance so the underlying
+    HTTP connection is reused instead of being re-established per manifest.
+    Conflicts (AlreadyExists) are reported per resource instead of aborting
+    the whole batch.
+
+    Parameters
+    ----------
+    yaml_docs : list[str]
+        The YAML manifest strings to apply.
+    namespace : str
+        The namespace into which to apply these resources.
+
+    Raises
+    ------
+    RuntimeError
+        If parsing fails, or if applying any manifest fails for a reason
+        other than AlreadyExists. All per-resource failures are aggregated
+        into a single error.
+    """
+    manifests = []
+    try:
+        for doc in yaml_docs:
+            for manifest in yaml.safe_load_all(doc):
+                if not manifest:
+                    continue
+                if not manifest.get("apiVersion") or not manifest.get("kind"):
+                    raise ValueError("YAML manifest must specify apiVersion and kind")
+                manifests.append(manifest)
+    except Exception as exc:
+        logger.error(f"Failed to parse manifests: {exc}")
+        raise RuntimeError(f"Failed to parse manifests: {exc}") from exc
+
+    if not manifests:
+        return
+
+    api_client = k8s_client.ApiClient()
+    custom_api = k8s_client.CustomObjectsApi(api_client)
+    errors = []
+    for manifest in manifests:
+        api_version = manifest["apiVersion"]
+        kind = manifest["kind"]
+        name = manifest.get("metadata", {}).get("name", "<unnamed>")
+        group, _, version = api_version.rpartition("/")
+        try:
+            if group:
+                # For custom resources (like Artifact)
+                custom_api.create_namespaced_custom_object(
+                    group=group,
+                    version=version,
+                    namespace=namespace,
+                    plural=f"{kind.lower()}s",  # Convention is to use lowercase plural
+                    body=manifest,
+                )
+            else:
+                # For core resources
+                create_from_yaml(
+                    k8s_client=api_client,
+                    yaml_file=yaml.dump(manifest),
+                    namespace=namespace,
+                )
+            logger.info(
+                f"{SUBSTEP_INDENT}Successfully applied {kind} '{name}' to namespace '{namespace}'"
+            )
+        except ApiException as exc:
+            if exc.status == HTTP_STATUS_CONFLICT:  # Already exists
+                logger.info(
+                    f"{SUBSTEP_INDENT}{kind} '{name}' already exists in namespace '{namespace}'"
+                )
+            else:
+                logger.error(f"Failed to apply {kind} '{name}': {exc}")
+                errors.append(f"{kind}/{name}: {exc}")
+        except Exception as exc:
+            # Same catch-all-to-RuntimeError conversion as apply_manifest,
+            # so callers that handle RuntimeError keep working for
+            # non-API failures (connection errors, bad bodies, ...).
+            logger.error(f"Failed to apply {kind} '{name}': {exc}")
+            errors.append(f"{kind}/{name}: {exc}")
+
+    if errors:
+        raise RuntimeError(f"Failed to apply manifests: {'; '.join(errors)}")
+
+
 def edactl_namespace_bootstrap(namespace: str) -> int | None:
     """
     Emulate `kubectl exec <toolbox_pod> -- edactl namespace bootstrap <namespace>`
@@ -246,19 +334,28 @@ def edactl_namespace_bootstrap(namespace: str) -> int | None:
 
 
 def wait_for_namespace(
-    namespace: str, max_retries: int = 10, retry_delay: int = 1
+    namespace: str,
+    max_retries: int = 10,
+    retry_delay: int = 1,
+    watch_timeout: int = 180,
 ) -> bool:
     """
-    Wait for a namespace to exist in Kubernetes.
+    Wait for a namespace to become Active in Kubernetes.
+
+    A watch stream returns as soon as the namespace appears instead of
+    sleeping between polls. The poll loop remains as a fallback for when
+    the watch stream ends without the namespace becoming Active.
 
     Parameters
     ----------
     namespace : str
         Namespace to wait for.
     max_retries : int
-        Maximum number of attempts.
+        Maximum number of fallback poll attempts.
     retry_delay : int
-        Delay (seconds) between attempts.
+        Delay (seconds) between fallback poll attempts.
+    watch_timeout : int
+        Upper bound (seconds) on the watch stream.
 
     Returns
     -------
@@ -271,6 +368,25 @@ def wait_for_namespace(
         If the namespace is not found within the given attempts.
     """
     v1 = k8s_client.CoreV1Api()
+    try:
+        w = watch.Watch()
+        for event in w.stream(
+            v1.list_namespace,
+            field_selector=f"metadata.name={namespace}",
+            timeout_seconds=watch_timeout,
+        ):
+            obj = event.get("object")
+            if obj is not None and getattr(obj.status, "phase", None) == "Active":
+                w.stop()
+                logger.info(f"{SUBSTEP_INDENT}Namespace {namespace} is available")
+                return True
+    except (ApiException, urllib3.exceptions.HTTPError) as exc:
+        # Long-lived watch streams typically die with urllib3 protocol or
+        # read-timeout errors on connection resets, not just ApiException.
+        logger.debug(
+            f"Watch on namespace '{namespace}' failed ({exc}); falling back to polling"
+        )
+
     for attempt in range(max_retries):
         try:
             v1.read_namespace(name=namespace)
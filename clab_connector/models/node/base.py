@@ -1,6 +1,7 @@
 # clab_connector/models/node/base.py
 
 import logging
+import re
 
 from clab_connector.clients.kubernetes.client import ping_from_bsvr
 from clab_connector.utils import helpers
@@ -8,6 +9,12 @@ from clab_connector.utils.exceptions import ClabConnectorError
 
 logger = logging.getLogger(__name__)
 
+# Role tokens looked up in node names, in priority order; one compiled
+# alternation replaces a chain of per-token substring scans.
+_ROLE_RE = re.compile(r"spine|borderleaf|dcgw|bl")
+_ROLE_PRIORITY = ("spine", "borderleaf", "bl", "dcgw")
+_ROLE_BY_TOKEN = {"bl": "borderleaf"}
+
 
 class Node:
     """
@@ -38,6 +45,11 @@ class Node:
         self.version = version
         self.mgmt_ipv4 = mgmt_ipv4
         self.mgmt_ipv4_prefix_length = mgmt_ipv4_prefix_length
+        self._role: str | None = None
+        # Lazy caches for derived names; a node belongs to one topology per
+        # run, so these never change once computed.
+        self._node_name: str | None = None
+        self._profile_name: str | None = None
 
     def _require_version(self):
         """Raise an error if the node has no software version defined."""
@@ -67,9 +79,9 @@ class Node:
         bool
             True if the ping is successful, raises a RuntimeError otherwise.
         """
-        logger.debug(f"Pinging node '{self.name}' IP {self.mgmt_ipv4}")
+        logger.debug("Pinging node '%s' IP %s", self.name, self.mgmt_ipv4)
         if ping_from_bsvr(self.mgmt_ipv4):
-            logger.debug(f"Ping to '{self.name}' ({self.mgmt_ipv4}) successful")
+            logger.debug("Ping to '%s' (%s) successful", self.name, self.mgmt_ipv4)
             return True
         else:
             msg = f"Ping to '{self.name}' ({self.mgmt_ipv4}) failed"
@@ -89,8 +101,39 @@ class Node:
         -------
         str
             A normalized node name safe for EDA.
+
+        Notes
+        -----
+        The result is cached on the instance: it is requested for every
+        toponode, topolink interface and post-integration step, and the
+        node name never changes within a run.
         """
-        return helpers.normalize_name(self.name)
+        if self._node_name is None:
+            self._node_name = helpers.normalize_name(self.name)
+        return self._node_name
+
+    def get_role(self):
+        """
+        Classify the node role from tokens in its name.
+
+        The name is scanned once with a compiled alternation and the
+        highest-priority token wins (spine > borderleaf/bl > dcgw), matching
+        the previous chain of substring checks. The result is cached on the
+        instance since the name never changes.
+
+        Returns
+        -------
+        str
+            One of "spine", "borderleaf", "dcgw" or the default "leaf".
+        """
+        if self._role is None:
+            tokens = set(_ROLE_RE.findall(self.name.lower()))
+            self._role = "leaf"
+            for token in _ROLE_PRIORITY:
+                if token in tokens:
+                    self._role = _ROLE_BY_TOKEN.get(token, token)
+                    break
+        return self._role
 
     def get_default_node_type(self):
         """
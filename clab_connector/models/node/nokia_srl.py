@@ -33,6 +33,10 @@ class NokiaSRLinuxNode(Node):
     # Mapping for EDA operating system
     EDA_OPERATING_SYSTEM: ClassVar[str] = "srl"
 
+    # Containerlab interface naming, e.g. 'e1-1'; compiled once since the
+    # conversion runs per topolink interface.
+    _IFNAME_RE: ClassVar[re.Pattern[str]] = re.compile(r"^e(\d+)-(\d+)$")
+
     def __init__(
         self,
         name,
@@ -172,14 +176,18 @@ class NokiaSRLinuxNode(Node):
         str
             The NodeProfile name for EDA.
         """
-        self._require_version()
-        return f"{topology.get_eda_safe_name()}-{self.NODE_TYPE}-{self.version}"
+        if self._profile_name is None:
+            self._require_version()
+            self._profile_name = (
+                f"{topology.get_eda_safe_name()}-{self.NODE_TYPE}-{self.version}"
+            )
+        return self._profile_name
 
     def get_node_profile(self, topology):
         """
         Render the NodeProfile YAML for this SR Linux node.
         """
-        logger.debug(f"Rendering node profile for {self.name}")
+        logger.debug("Rendering node profile for %s", self.name)
         self._require_version()
         artifact_name = self.get_artifact_name()
         filename = f"srlinux-{self.version}.zip"
@@ -202,22 +210,15 @@ class NokiaSRLinuxNode(Node):
             "sw_image_md5": self.SRL_IMAGE_MD5.format(version=self.version),
             "llm_db": self.LLM_DB_PATH.format(version=self.version),
         }
-        return helpers.render_template("node-profile.j2", data)
+        return helpers.render_template_cached("node-profile.j2", data)
 
     def get_toponode(self, topology):
         """
         Render the TopoNode YAML for this SR Linux node.
         """
-        logger.info(f"{SUBSTEP_INDENT}Creating toponode for {self.name}")
+        logger.debug("%sRendering toponode for %s", SUBSTEP_INDENT, self.name)
         self._require_version()
-        role_value = "leaf"
-        nl = self.name.lower()
-        if "spine" in nl:
-            role_value = "spine"
-        elif "borderleaf" in nl or "bl" in nl:
-            role_value = "borderleaf"
-        elif "dcgw" in nl:
-            role_value = "dcgw"
+        role_value = self.get_role()
 
         data = {
             "namespace": topology.namespace,
@@ -247,8 +248,7 @@ class NokiaSRLinuxNode(Node):
         str
             SR Linux style name, e.g. 'ethernet-1-1'.
         """
-        pattern = re.compile(r"^e(\d+)-(\d+)$")
-        match = pattern.match(ifname)
+        match = self._IFNAME_RE.match(ifname)
         if match:
             return f"ethernet-{match.group(1)}-{match.group(2)}"
         return ifname
@@ -278,7 +278,7 @@ class NokiaSRLinuxNode(Node):
         str
             The rendered Interface CR YAML.
         """
-        logger.debug(f"{SUBSTEP_INDENT}Creating topolink interface for {self.name}")
+        logger.debug("%sCreating topolink interface for %s", SUBSTEP_INDENT, self.name)
         role = "interSwitch"
         if other_node is None or not other_node.is_eda_supported():
             role = "edge"
@@ -169,17 +169,21 @@ class NokiaSROSNode(Node):
         Make sure it follows Kubernetes naming conventions (lowercase)
         and includes the topology name to ensure uniqueness.
         """
-        # Convert version to lowercase to comply with K8s naming rules
-        self._require_version()
-        normalized_version = self._normalize_version(self.version)
-        # Include the topology name in the profile name for uniqueness
-        return f"{topology.get_eda_safe_name()}-sros-{normalized_version}"
+        if self._profile_name is None:
+            # Convert version to lowercase to comply with K8s naming rules
+            self._require_version()
+            normalized_version = self._normalize_version(self.version)
+            # Include the topology name in the profile name for uniqueness
+            self._profile_name = (
+                f"{topology.get_eda_safe_name()}-sros-{normalized_version}"
+            )
+        return self._profile_name
 
     def get_node_profile(self, topology):
         """
         Render the NodeProfile YAML for this SROS node.
         """
-        logger.debug(f"Rendering node profile for {self.name}")
+        logger.debug("Rendering node profile for %s", self.name)
         self._require_version()
         artifact_name = self.get_artifact_name()
         normalized_version = self._normalize_version(self.version)
@@ -208,13 +212,13 @@ class NokiaSROSNode(Node):
                 version=normalized_version, version_short=version_short
             ),
         }
-        return helpers.render_template("node-profile.j2", data)
+        return helpers.render_template_cached("node-profile.j2", data)
 
     def get_toponode(self, topology):
         """
         Render the TopoNode YAML for this SROS node.
         """
-        logger.info(f"{SUBSTEP_INDENT}Creating toponode for {self.name}")
+        logger.debug("%sRendering toponode for %s", SUBSTEP_INDENT, self.name)
         self._require_version()
         role_value = "backbone"
 
@@ -349,7 +353,7 @@ class NokiaSROSNode(Node):
         """
         Render the Interface CR YAML for an SROS link endpoint.
         """
-        logger.debug(f"{SUBSTEP_INDENT}Creating topolink interface for {self.name}")
+        logger.debug("%sCreating topolink interface for %s", SUBSTEP_INDENT, self.name)
         role = "interSwitch"
         if other_node is None or not other_node.is_eda_supported():
             role = "edge"
@@ -4,6 +4,11 @@ import json
 import logging
 import os
 
+try:  # optional dependency for faster topology parsing
+    import orjson
+except ImportError:
+    orjson = None
+
 from clab_connector.models.link import create_link
 from clab_connector.models.node.base import Node
 from clab_connector.models.node.factory import create_node
@@ -56,6 +61,12 @@ class Topology:
         self.clab_file_path = clab_file_path
         self._namespace_overridden = namespace is not None
         self.namespace = namespace or f"clab-{self.name}"
+        self._eda_safe_name: str | None = None
+        # Per-kind index so kind-filtered phases (e.g. post-integration)
+        # don't have to rescan the full node list.
+        self.nodes_by_kind: dict[str, list] = {}
+        for node in self.nodes:
+            self.nodes_by_kind.setdefault(node.kind, []).append(node)
 
     def __repr__(self):
         """
@@ -75,18 +86,24 @@ class Topology:
         """
         Convert the topology name into a format safe for use in EDA.
 
+        The result is cached on the instance since it is requested per node
+        when building profile and toponode names, and the conversion is
+        idempotent (the parser renames the topology to its safe name).
+
         Returns
         -------
         str
             A name suitable for EDA resource naming.
         """
-        safe = self.name.lower().replace("_", "-").replace(" ", "-")
-        safe = "".join(c for c in safe if c.isalnum() or c in ".-").strip(".-")
-        if not safe or not safe[0].isalnum():
-            safe = "x" + safe
-        if not safe[-1].isalnum():
-            safe += "0"
-        return safe
+        if self._eda_safe_name is None:
+            safe = self.name.lower().replace("_", "-").replace(" ", "-")
+            safe = "".join(c for c in safe if c.isalnum() or c in ".-").strip(".-")
+            if not safe or not safe[0].isalnum():
+                safe = "x" + safe
+            if not safe[-1].isalnum():
+                safe += "0"
+            self._eda_safe_name = safe
+        return self._eda_safe_name
 
     def set_namespace(self, namespace: str):
         """Explicitly set the namespace for the topology."""
@@ -135,10 +152,16 @@ class Topology:
                 profiles[key] = prof
         return profiles.values()
 
-    def get_toponodes(self):
+    def get_toponodes(self, only_nodes: set[str] | None = None):
         """
         Generate TopoNode YAML for all EDA-supported nodes.
 
+        Parameters
+        ----------
+        only_nodes : set[str] | None
+            When given, only nodes whose EDA node name is in the set are
+            included. Used for incremental re-integration.
+
         Returns
         -------
         list
@@ -146,12 +169,16 @@ class Topology:
         """
         tnodes = []
         for n in self.nodes:
+            if only_nodes is not None and n.get_node_name(self) not in only_nodes:
+                continue
             tn = n.get_toponode(self)
             if tn:
                 tnodes.append(tn)
         return tnodes
 
-    def get_topolinks(self, skip_edge_links: bool = False):
+    def get_topolinks(
+        self, skip_edge_links: bool = False, only_links: set[str] | None = None
+    ):
         """Generate TopoLink YAML for all EDA-supported links.
 
         Parameters
@@ -159,6 +186,9 @@ class Topology:
         skip_edge_links : bool, optional
             When True, omit TopoLink resources for edge links (links with only
             one EDA supported endpoint). Defaults to False.
+        only_links : set[str] | None
+            When given, only links whose EDA link name is in the set are
+            included. Used for incremental re-integration.
 
         Returns
         -------
@@ -169,6 +199,8 @@ class Topology:
         for ln in self.links:
             if skip_edge_links and ln.is_edge_link():
                 continue
+            if only_links is not None and ln.get_link_name(self) not in only_links:
+                continue
             if ln.is_topolink() or ln.is_edge_link():
                 link_yaml = ln.get_topolink_yaml(self)
                 if link_yaml:
@@ -180,6 +212,7 @@ class Topology:
         skip_edge_link_interfaces: bool = False,
         edge_encapsulation: str | None = None,
         isl_encapsulation: str | None = None,
+        only_links: set[str] | None = None,
     ):
         """
         Generate Interface YAML for each link endpoint (if EDA-supported).
@@ -189,6 +222,9 @@ class Topology:
         skip_edge_link_interfaces : bool, optional
             When True, interface resources for edge links (links where only one
             side is EDA-supported) are omitted. Defaults to False.
+        only_links : set[str] | None
+            When given, only endpoints of links whose EDA link name is in the
+            set are included. Used for incremental re-integration.
 
         Returns
         -------
@@ -197,6 +233,12 @@ class Topology:
         """
         interfaces = []
         for ln in self.links:
+            if only_links is not None and (
+                ln.node_1 is None
+                or ln.node_2 is None
+                or ln.get_link_name(self) not in only_links
+            ):
+                continue
             is_edge = ln.is_edge_link()
             for node, ifname, peer in (
                 (ln.node_1, ln.intf_1, ln.node_2),
@@ -228,9 +270,13 @@ def _load_topology_data(path: str) -> dict:
         raise TopologyFileError(f"Topology file '{path}' does not exist!")
 
     try:
+        if orjson is not None:
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
         with open(path) as f:
             return json.load(f)
-    except json.JSONDecodeError as e:
+    except ValueError as e:
+        # Covers json.JSONDecodeError and orjson.JSONDecodeError alike
         logger.critical(f"File '{path}' is not valid JSON.")
         raise TopologyFileError(f"File '{path}' is not valid JSON.") from e
     except OSError as e:
@@ -51,14 +51,19 @@ def _run_with_retry(
 # --------------------------------------------------------------------------- #
 # SSH helpers                                                                 #
 # --------------------------------------------------------------------------- #
-def verify_ssh_credentials(
+def open_ssh_client(
     mgmt_ip: str,
     username: str,
     passwords: list[str],
     quiet: bool = False,
-) -> str | None:
+) -> tuple[str | None, paramiko.SSHClient | None]:
     """
-    Return the first password that opens an SSH session, else None.
+    Return ``(password, connected client)`` for the first password that works.
+
+    The client is left open so callers can reuse the session for SFTP and
+    shell commands instead of paying the SSH key exchange again; the caller
+    owns the client and must close it. Returns ``(None, None)`` if no
+    password succeeds.
     """
     for pw in passwords:
         client = paramiko.SSHClient()
@@ -86,74 +91,109 @@ def verify_ssh_credentials(
             # If we reach this point authentication succeeded.
             if not quiet:
                 logger.info("Password '%s' works for %s", pw, mgmt_ip)
-            return pw
+            return pw, client
 
         except paramiko.AuthenticationException:
             if not quiet:
                 logger.debug("Password '%s' rejected for %s", pw, mgmt_ip)
+            with contextlib.suppress(Exception):
+                client.close()
         except (TimeoutError, OSError, paramiko.SSHException) as e:
             if not quiet:
                 logger.debug("SSH connection problem with %s: %s", mgmt_ip, e)
-        finally:
             with contextlib.suppress(Exception):
                 client.close()
 
-    return None
+    return None, None
+
+
+def verify_ssh_credentials(
+    mgmt_ip: str,
+    username: str,
+    passwords: list[str],
+    quiet: bool = False,
+) -> str | None:
+    """
+    Return the first password that opens an SSH session, else None.
+    """
+    pw, client = open_ssh_client(mgmt_ip, username, passwords, quiet)
+    if client is not None:
+        with contextlib.suppress(Exception):
+            client.close()
+    return pw
 
 
-def transfer_file(
-    src_path: Path,
-    dest_path: str,
+def transfer_files(
+    file_pairs: list[tuple[Path, str]],
     username: str,
     mgmt_ip: str,
     password: str,
     quiet: bool = False,
+    client: paramiko.SSHClient | None = None,
 ) -> bool:
     """
-    SCP file to the target node using Paramiko SFTP.
+    SCP several files to the target node over a single SSH session.
+
+    One SFTP channel is opened and reused for every file, so the SSH key
+    exchange is paid once per batch instead of once per file. When an
+    already-connected `client` is given its session is reused (and left
+    open); otherwise a dedicated transport is opened and torn down here.
+    Returns True only if every file transfers.
     """
+    transport = None
     try:
-        if not quiet:
-            logger.debug("SCP %s → %s@%s:%s", src_path, username, mgmt_ip, dest_path)
-
-        transport = paramiko.Transport((mgmt_ip, 22))
-        transport.connect(username=username, password=password)
-
-        sftp = paramiko.SFTPClient.from_transport(transport)
-        sftp.put(str(src_path), dest_path)
+        if client is not None:
+            sftp = client.open_sftp()
+        else:
+            transport = paramiko.Transport((mgmt_ip, 22))
+            transport.connect(username=username, password=password)
+            sftp = paramiko.SFTPClient.from_transport(transport)
+        for src_path, dest_path in file_pairs:
+            if not quiet:
+                logger.debug(
+                    "SCP %s → %s@%s:%s", src_path, username, mgmt_ip, dest_path
+                )
+            sftp.put(str(src_path), dest_path)
         sftp.close()
-        transport.close()
         return True
     except Exception as e:
         if not quiet:
             logger.debug("SCP failed: %s", e)
         return False
+    finally:
+        if transport is not None:
+            with contextlib.suppress(Exception):
+                transport.close()
 
 
 def execute_ssh_commands(
-    script_path: Path,
+    commands: list[str],
     username: str,
     mgmt_ip: str,
     node_name: str,
     password: str,
     quiet: bool = False,
+    client: paramiko.SSHClient | None = None,
 ) -> bool:
     """
-    Push the command file line-by-line over an interactive shell.
+    Push the commands line-by-line over an interactive shell.
     No timeouts version that will wait as long as needed for each command.
+
+    When an already-connected `client` is given its session is reused and
+    left open for the caller; otherwise a fresh connection is made.
     """
+    own_client = client is None
     try:
-        commands = script_path.read_text().splitlines()
-
-        client = paramiko.SSHClient()
-        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        client.connect(
-            hostname=mgmt_ip,
-            username=username,
-            password=password,
-            allow_agent=False,
-            look_for_keys=False,
-        )
+        if own_client:
+            client = paramiko.SSHClient()
+            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            client.connect(
+                hostname=mgmt_ip,
+                username=username,
+                password=password,
+                allow_agent=False,
+                look_for_keys=False,
+            )
 
         chan = client.invoke_shell()
         output = []
@@ -178,7 +218,8 @@ def execute_ssh_commands(
             output.append(chan.recv(4096).decode())
 
         chan.close()
-        client.close()
+        if own_client:
+            client.close()
 
         if not quiet:
             logger.info(
@@ -270,77 +311,62 @@ def _copy_files_and_config(
     mgmt_ip: str,
     working_pw: str,
     quiet: bool,
+    client: paramiko.SSHClient | None = None,
 ) -> str:
     logger.info("Copying files to device …")
 
     for root in dest_roots:
         logger.info(f"Attempting to copy files to root: {root}")
 
-        cfg_success = transfer_file(
-            config_p, root + "startup-config", username, mgmt_ip, working_pw, quiet
-        )
-        if cfg_success:
-            logger.info(f"Config copied successfully to {root}startup-config")
-        else:
-            logger.warning(f"Failed to copy config to {root}startup-config")
-            continue
-
         _build_post_script(postscript_p, root)
-        post_success = transfer_file(
-            postscript_p, root + "copy_certs.sh", username, mgmt_ip, working_pw, quiet
-        )
-        if post_success:
-            logger.info(f"Post script copied successfully to {root}copy_certs.sh")
-        else:
-            logger.warning(f"Failed to copy post script to {root}copy_certs.sh")
-            continue
-
-        cert_success = transfer_file(
-            cert_p, root + "edaboot.crt", username, mgmt_ip, working_pw, quiet
-        )
-        if cert_success:
-            logger.info(f"Certificate copied successfully to {root}edaboot.crt")
-        else:
-            logger.warning(f"Failed to copy certificate to {root}edaboot.crt")
-            continue
-
-        key_success = transfer_file(
-            key_p, root + "edaboot.key", username, mgmt_ip, working_pw, quiet
-        )
-        if key_success:
-            logger.info(f"Private key copied successfully to {root}edaboot.key")
+        if transfer_files(
+            [
+                (config_p, root + "startup-config"),
+                (postscript_p, root + "copy_certs.sh"),
+                (cert_p, root + "edaboot.crt"),
+                (key_p, root + "edaboot.key"),
+            ],
+            username,
+            mgmt_ip,
+            working_pw,
+            quiet,
+            client=client,
+        ):
             logger.info(f"All files copied successfully using root: {root}")
             return root
-        else:
-            logger.warning(f"Failed to copy private key to {root}edaboot.key")
+        logger.warning(f"Failed to copy files using root: {root}")
 
     raise RuntimeError("Failed to copy files to device")
 
 
-def _build_enable_scp_script(script_p: Path) -> None:
-    with script_p.open("w") as f:
-        f.write("enable\n")
-        f.write("configure terminal\n")
-        f.write("aaa authorization exec default local\n")
-        f.write("exit\n")
-        f.write("write\n")
-
-
-def _build_command_script(script_p: Path, dest_root: str) -> None:
-    with script_p.open("w") as f:
-        f.write("enable\n")
-        f.write("configure replace startup-config ignore-errors\n")
-        f.write(f"copy file:{dest_root}edaboot.crt certificate:\n")
-        f.write(f"copy file:{dest_root}edaboot.key sslkey:\n")
-        f.write("configure terminal\n")
-        f.write("management api gnmi\n")
-        f.write("    transport grpc discovery\n")
-        f.write("    ssl profile edaboot\n")
-        f.write("management api gnmi\n")
-        f.write("    transport grpc mgmt\n")
-        f.write("    ssl profile EDA\n")
-        f.write("exit\n")
-        f.write("write\n")
+def _enable_scp_commands() -> list[str]:
+    """Build the CLI command sequence that enables SCP on the node."""
+    return [
+        "enable",
+        "configure terminal",
+        "aaa authorization exec default local",
+        "exit",
+        "write",
+    ]
+
+
+def _integrate_commands(dest_root: str) -> list[str]:
+    """Build the CLI command sequence pushed over the interactive shell."""
+    return [
+        "enable",
+        "configure replace startup-config ignore-errors",
+        f"copy file:{dest_root}edaboot.crt certificate:",
+        f"copy file:{dest_root}edaboot.key sslkey:",
+        "configure terminal",
+        "management api gnmi",
+        "    transport grpc discovery",
+        "    ssl profile edaboot",
+        "management api gnmi",
+        "    transport grpc mgmt",
+        "    ssl profile EDA",
+        "exit",
+        "write",
+    ]
 
 
 def _build_post_script(script_p: Path, dest_root: str) -> None:
@@ -379,30 +405,33 @@ def prepare_ceos_node(
     pwd_list.append("admin")
 
     logger.info("Verifying SSH credentials for %s ...", node_name)
-    working_pw = verify_ssh_credentials(mgmt_ip, username, pwd_list, quiet)
+    working_pw, ssh_client = open_ssh_client(mgmt_ip, username, pwd_list, quiet)
 
     if not working_pw:
         logger.error("No valid password found - aborting")
         return False
-    # 2. create temp artefacts
+    # 2. create temp artefacts; reuse the verified SSH session for the file
+    #    copy and both command pushes (one key exchange per node)
     with tempfile.TemporaryDirectory() as tdir:
         tdir_path = Path(tdir)
         cert_p = tdir_path / "edaboot.crt"
         key_p = tdir_path / "edaboot.key"
         cfg_p = tdir_path / "startup-config"
         post_p = tdir_path / "copy-certs.sh"
-        prescript_p = tdir_path / "ceos_enable_scp.txt"
-        script_p = tdir_path / "ceos_integrate_commands.txt"
 
         try:
             _extract_cert_and_config(
                 node_name, namespace, version, cert_p, key_p, cfg_p, quiet
             )
 
-            _build_enable_scp_script(prescript_p)
-
             if not execute_ssh_commands(
-                prescript_p, username, mgmt_ip, node_name, working_pw, quiet
+                _enable_scp_commands(),
+                username,
+                mgmt_ip,
+                node_name,
+                working_pw,
+                quiet,
+                client=ssh_client,
             ):
                 raise RuntimeError("Unable to enable SCP")
 
@@ -416,13 +445,18 @@ def prepare_ceos_node(
                 mgmt_ip,
                 working_pw,
                 quiet,
+                client=ssh_client,
             )
 
-            _build_command_script(script_p, dest_root)
-
             logger.info("Pushing configuration to %s …", node_name)
             return execute_ssh_commands(
-                script_p, username, mgmt_ip, node_name, working_pw, quiet
+                _integrate_commands(dest_root),
+                username,
+                mgmt_ip,
+                node_name,
+                working_pw,
+                quiet,
+                client=ssh_client,
             )
 
         except (
@@ -436,3 +470,6 @@ def prepare_ceos_node(
         except Exception as e:
             logger.exception("Unexpected error: %s", e)
             return False
+        finally:
+            with contextlib.suppress(Exception):
+                ssh_client.close()
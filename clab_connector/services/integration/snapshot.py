@@ -0,0 +1,244 @@
+# clab_connector/services/integration/snapshot.py
+
+"""
+Snapshot support for incremental topology re-integration.
+
+A snapshot records a fingerprint per node and per link of the last
+successfully integrated topology, keyed by the EDA resource name. On a
+later run the integrator diffs the freshly parsed topology against the
+snapshot and only submits resources that were added or changed, plus
+delete items for resources that disappeared.
+
+The run options that shape the generated resources (edge-interface
+skipping, encapsulations) are stored alongside the fingerprints; a
+snapshot taken under different options is not usable for diffing, since
+identical fingerprints would then mask resources that still need to be
+(re)created.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = Path.home() / ".clab-connector"
+
+
+def _digest(payload: dict) -> str:
+    """Return a short blake2b digest of a canonical JSON encoding."""
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def node_fingerprint(node) -> str:
+    """
+    Compute a fingerprint over the node fields that affect EDA resources.
+
+    Parameters
+    ----------
+    node : Node
+        The node to fingerprint.
+
+    Returns
+    -------
+    str
+        A hex digest that changes whenever the node's EDA-relevant
+        configuration changes.
+    """
+    return _digest(
+        {
+            "name": node.name,
+            "kind": node.kind,
+            "type": node.node_type,
+            "version": node.version,
+            "mgmt_ipv4": node.mgmt_ipv4,
+            "mgmt_ipv4_prefix_length": node.mgmt_ipv4_prefix_length,
+        }
+    )
+
+
+def link_fingerprint(link) -> str:
+    """
+    Compute a fingerprint over a link's endpoints.
+
+    Parameters
+    ----------
+    link : Link
+        The link to fingerprint.
+
+    Returns
+    -------
+    str
+        A hex digest that changes whenever the link's endpoints change.
+    """
+    return _digest(
+        {
+            "node_1": link.node_1.name if link.node_1 else None,
+            "intf_1": link.intf_1,
+            "node_2": link.node_2.name if link.node_2 else None,
+            "intf_2": link.intf_2,
+        }
+    )
+
+
+@dataclass
+class TopologyDelta:
+    """
+    Difference between the current topology and the prior snapshot.
+
+    Resource names are the EDA names (TopoNode / TopoLink), so removed
+    entries can be turned into delete transaction items directly. A None
+    delta means no snapshot existed and a full integration is required.
+    """
+
+    changed_nodes: set[str] = field(default_factory=set)
+    changed_links: set[str] = field(default_factory=set)
+    removed_nodes: set[str] = field(default_factory=set)
+    removed_links: set[str] = field(default_factory=set)
+
+    def is_empty(self) -> bool:
+        """Return True if nothing was added, changed or removed."""
+        return not (
+            self.changed_nodes
+            or self.changed_links
+            or self.removed_nodes
+            or self.removed_links
+        )
+
+
+class TopologySnapshot:
+    """
+    Per-namespace record of the last integrated topology.
+
+    Parameters
+    ----------
+    namespace : str
+        The EDA namespace the snapshot belongs to; used as file name under
+        ~/.clab-connector/.
+    """
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self.path = SNAPSHOT_DIR / f"{namespace}.snapshot.json"
+        self.nodes: dict[str, str] = {}
+        self.links: dict[str, str] = {}
+        self.options: dict = {}
+
+    def load(self, options: dict | None = None) -> bool:
+        """
+        Load a prior snapshot from disk.
+
+        Parameters
+        ----------
+        options : dict | None
+            The current run's options. If given and they differ from the
+            options the snapshot was taken under, the snapshot is rejected:
+            the fingerprints would hide resources whose rendered form
+            depends on the options (e.g. edge links after toggling
+            --skip-edge-intfs, or a changed encapsulation).
+
+        Returns
+        -------
+        bool
+            True if a usable snapshot was found, False otherwise.
+        """
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return False
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable snapshot '{self.path}': {e}")
+            return False
+        stored_options = data.get("options", {})
+        if options is not None and stored_options != options:
+            logger.info(
+                "Prior integration used different options; ignoring snapshot"
+            )
+            return False
+        self.nodes = data.get("nodes", {})
+        self.links = data.get("links", {})
+        self.options = stored_options
+        return True
+
+    def diff(self, topology) -> TopologyDelta:
+        """
+        Compare a topology against this snapshot.
+
+        Parameters
+        ----------
+        topology : Topology
+            The freshly parsed topology.
+
+        Returns
+        -------
+        TopologyDelta
+            The added/changed and removed resource names.
+        """
+        current_nodes, current_links = _fingerprints(topology)
+        return TopologyDelta(
+            changed_nodes={
+                name
+                for name, digest in current_nodes.items()
+                if self.nodes.get(name) != digest
+            },
+            changed_links={
+                name
+                for name, digest in current_links.items()
+                if self.links.get(name) != digest
+            },
+            removed_nodes=set(self.nodes) - set(current_nodes),
+            removed_links=set(self.links) - set(current_links),
+        )
+
+    def capture(self, topology, options: dict | None = None) -> None:
+        """
+        Replace the stored fingerprints with the topology's current state.
+
+        Parameters
+        ----------
+        topology : Topology
+            The topology that was just integrated.
+        options : dict | None
+            The run options the integration was performed under; recorded
+            so a later run with different options rejects the snapshot.
+        """
+        self.nodes, self.links = _fingerprints(topology)
+        self.options = options or {}
+
+    def save(self) -> None:
+        """Persist the snapshot to disk, creating the directory if needed."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(
+            json.dumps(
+                {"options": self.options, "nodes": self.nodes, "links": self.links},
+                indent=2,
+            )
+        )
+        logger.debug(f"Saved topology snapshot to '{self.path}'")
+
+    def delete(self) -> None:
+        """Remove the snapshot file, if present."""
+        try:
+            self.path.unlink()
+            logger.debug(f"Removed topology snapshot '{self.path}'")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove snapshot '{self.path}': {e}")
+
+
+def _fingerprints(topology) -> tuple[dict[str, str], dict[str, str]]:
+    """Build {resource name: fingerprint} maps for a topology's nodes and links."""
+    nodes = {
+        node.get_node_name(topology): node_fingerprint(node)
+        for node in topology.nodes
+    }
+    links = {
+        link.get_link_name(topology): link_fingerprint(link)
+        for link in topology.links
+        if link.node_1 is not None and link.node_2 is not None
+    }
+    return nodes, links
@@ -1,17 +1,18 @@
 # clab_connector/services/integration/topology_integrator.py (updated)
 
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 from clab_connector.clients.eda.client import EDAClient
 from clab_connector.clients.kubernetes.client import (
-    apply_manifest,
+    apply_manifests_batch,
     edactl_namespace_bootstrap,
     update_namespace_description,
     wait_for_namespace,
 )
 from clab_connector.models.topology import parse_topology_file
 from clab_connector.services.integration.ceos_post_integration import prepare_ceos_node
+from clab_connector.services.integration.snapshot import TopologySnapshot
 from clab_connector.services.integration.sros_post_integration import prepare_sros_node
 from clab_connector.services.status.node_sync_checker import NodeSyncChecker
 from clab_connector.utils import helpers
@@ -20,6 +21,14 @@ from clab_connector.utils.exceptions import ClabConnectorError, EDAConnectionErr
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of pending transaction items before an early commit is
+# forced, to stay clear of EDA-side request-size limits.
+MAX_TRANSACTION_ITEMS = 50
+
+# Upper bound on concurrent per-node post-integration sessions, to avoid
+# overwhelming the management plane with parallel SSH/kubectl work.
+POST_INTEGRATION_MAX_WORKERS = 16
+
 
 class TopologyIntegrator:
     """
@@ -43,6 +52,16 @@ class TopologyIntegrator:
         self.sync_timeout = sync_timeout
         self.edge_encapsulation: str | None = None
         self.isl_encapsulation: str | None = None
+        self.snapshot: TopologySnapshot | None = None
+        self.delta = None
+        # Per-phase inputs built by _precompute()
+        self._artifact_batches: dict = {}
+        self._node_profile_yamls: list = []
+        self._toponode_names: list = []
+        self._toponode_yamls: list = []
+        self._topolink_if_yamls: list = []
+        self._topolink_yamls: list = []
+        self._post_nodes: list = []
 
     def run(
         self,
@@ -92,12 +111,36 @@ class TopologyIntegrator:
             )
         )
 
+        # Diff against the snapshot of the last successful integration (if
+        # any) so unchanged nodes and links can be skipped. The snapshot is
+        # only usable if it was taken under the same run options, since the
+        # fingerprints don't cover option-dependent output.
+        run_options = {
+            "skip_edge_intfs": skip_edge_intfs,
+            "edge_encapsulation": edge_encapsulation,
+            "isl_encapsulation": isl_encapsulation,
+        }
+        self.snapshot = TopologySnapshot(self.topology.namespace)
+        if self.snapshot.load(options=run_options):
+            self.delta = self.snapshot.diff(self.topology)
+            logger.info(
+                f"{SUBSTEP_INDENT}Prior integration found: "
+                f"{len(self.delta.changed_nodes)} node(s) and "
+                f"{len(self.delta.changed_links)} link(s) to apply, "
+                f"{len(self.delta.removed_nodes) + len(self.delta.removed_links)} to remove"
+            )
+        else:
+            self.delta = None
+
         logger.info("== Running pre-checks ==")
         self.prechecks()
 
         # Verify connectivity to each node's management interface
         self.topology.check_connectivity()
 
+        # Build all phase inputs in one pass over the topology
+        self._precompute(skip_edge_intfs)
+
         logger.info("== Creating namespace ==")
         self.create_namespace()
 
@@ -118,34 +161,39 @@ class TopologyIntegrator:
 
         logger.info("== Creating node profiles ==")
         self.create_node_profiles()
-        self.commit_transaction("create node profiles")
 
         logger.info("== Onboarding nodes ==")
         self.create_toponodes()
-        # Nodes are committed in batches within create_toponodes method
 
         logger.info("== Adding topolink interfaces ==")
-        self.create_topolink_interfaces(
-            skip_edge_intfs,
-            edge_encapsulation=self.edge_encapsulation,
-            isl_encapsulation=self.isl_encapsulation,
-        )
-        # Only commit if there are transactions
-        if self.eda_client.transactions:
-            self.commit_transaction("create topolink interfaces")
-        else:
-            logger.info(f"{SUBSTEP_INDENT}No topolink interfaces to create, skipping.")
+        self.create_topolink_interfaces()
 
         logger.info("== Creating topolinks ==")
-        self.create_topolinks(skip_edge_intfs)
-        # Only commit if there are transactions
+        self.create_topolinks()
+
+        if self.delta and (self.delta.removed_nodes or self.delta.removed_links):
+            logger.info("== Removing stale resources ==")
+            self.remove_stale_resources()
+
+        # Node profiles, toponodes, topolink interfaces and topolinks are
+        # resolved together by EDA, so commit them as a single transaction.
+        # Oversized batches are flushed early by the create_* methods.
         if self.eda_client.transactions:
-            self.commit_transaction("create topolinks")
+            self.commit_transaction("create topology")
         else:
-            logger.info(f"{SUBSTEP_INDENT}No topolinks to create, skipping.")
+            logger.info(
+                f"{SUBSTEP_INDENT}No topology resources to create, skipping commit."
+            )
+
+        # Record the integrated state for future incremental runs
+        self.snapshot.capture(self.topology, options=run_options)
+        self.snapshot.save()
 
-        logger.info("== Running post-integration steps ==")
-        self.run_post_integration()
+        # SRL-only topologies have nothing to post-integrate; skip the
+        # whole phase (and its banner) instead of discovering that inside.
+        if self._post_nodes:
+            logger.info("== Running post-integration steps ==")
+            self.run_post_integration()
 
         # Check node synchronization if enabled
         if self.enable_sync_checking:
@@ -168,6 +216,77 @@ class TopologyIntegrator:
         if not self.eda_client.is_authenticated():
             raise EDAConnectionError("EDA credentials invalid")
 
+    def _precompute(self, skip_edge_intfs: bool):
+        """
+        Walk the topology once and build the inputs for every phase.
+
+        Each create_* phase used to re-iterate topology.nodes and .links on
+        its own; a single pass now produces the artifact batches, node
+        profile and toponode YAMLs, and the post-integration node list,
+        with the link-derived YAML lists built once alongside. The phase
+        methods then just consume the pre-built lists.
+
+        Parameters
+        ----------
+        skip_edge_intfs : bool
+            When True, omit edge link resources and their interfaces.
+        """
+        only_nodes = self.delta.changed_nodes if self.delta else None
+
+        nodes_by_artifact: dict = {}
+        profiles: dict = {}
+        toponode_names = []
+        toponode_yamls = []
+        post_nodes = [
+            node
+            for kind in ("nokia_sros", "nokia_srsim", "arista_ceos")
+            for node in self.topology.nodes_by_kind.get(kind, [])
+        ]
+        for node in self.topology.nodes:
+            if node.needs_artifact():
+                artifact_name, filename, download_url = node.get_artifact_info()
+                if not artifact_name or not filename or not download_url:
+                    logger.warning(
+                        f"{SUBSTEP_INDENT}No artifact info for node {node.name}; skipping."
+                    )
+                else:
+                    if artifact_name not in nodes_by_artifact:
+                        nodes_by_artifact[artifact_name] = {
+                            "nodes": [],
+                            "filename": filename,
+                            "download_url": download_url,
+                            "version": node.version,
+                        }
+                    nodes_by_artifact[artifact_name]["nodes"].append(node.name)
+
+            prof = node.get_node_profile(self.topology)
+            if prof:
+                profiles[f"{node.kind}-{node.version}"] = prof
+
+            node_name = node.get_node_name(self.topology)
+            if only_nodes is None or node_name in only_nodes:
+                tn = node.get_toponode(self.topology)
+                if tn:
+                    toponode_names.append(node_name)
+                    toponode_yamls.append(tn)
+
+        self._artifact_batches = nodes_by_artifact
+        self._node_profile_yamls = list(profiles.values())
+        self._toponode_names = toponode_names
+        self._toponode_yamls = toponode_yamls
+        self._post_nodes = post_nodes
+
+        only_links = self.delta.changed_links if self.delta else None
+        self._topolink_if_yamls = self.topology.get_topolink_interfaces(
+            skip_edge_link_interfaces=skip_edge_intfs,
+            edge_encapsulation=self.edge_encapsulation,
+            isl_encapsulation=self.isl_encapsulation,
+            only_links=only_links,
+        )
+        self._topolink_yamls = self.topology.get_topolinks(
+            skip_edge_links=skip_edge_intfs, only_links=only_links
+        )
+
     def create_namespace(self):
         """
         Create and bootstrap a namespace for the topology in EDA.
@@ -194,26 +313,8 @@ class TopologyIntegrator:
         Skips creation if already exists or no artifact data is available.
         """
         logger.info(f"{SUBSTEP_INDENT}Creating artifacts for nodes that need them")
-        nodes_by_artifact = {}
-        for node in self.topology.nodes:
-            if not node.needs_artifact():
-                continue
-            artifact_name, filename, download_url = node.get_artifact_info()
-            if not artifact_name or not filename or not download_url:
-                logger.warning(
-                    f"{SUBSTEP_INDENT}No artifact info for node {node.name}; skipping."
-                )
-                continue
-            if artifact_name not in nodes_by_artifact:
-                nodes_by_artifact[artifact_name] = {
-                    "nodes": [],
-                    "filename": filename,
-                    "download_url": download_url,
-                    "version": node.version,
-                }
-            nodes_by_artifact[artifact_name]["nodes"].append(node.name)
-
-        for artifact_name, info in nodes_by_artifact.items():
+        artifact_yamls = []
+        for artifact_name, info in self._artifact_batches.items():
             first_node = info["nodes"][0]
             logger.info(
                 f"{SUBSTEP_INDENT}Creating YANG artifact for node: {first_node} (version={info['version']})"
@@ -226,26 +327,60 @@ class TopologyIntegrator:
                     f"{SUBSTEP_INDENT}Could not generate artifact YAML for {first_node}"
                 )
                 continue
-            try:
-                apply_manifest(artifact_yaml, namespace="eda-system")
-                logger.info(f"{SUBSTEP_INDENT}Artifact '{artifact_name}' created.")
-                other_nodes = info["nodes"][1:]
-                if other_nodes:
-                    logger.info(
-                        f"{SUBSTEP_INDENT}Using same artifact for nodes: {', '.join(other_nodes)}"
-                    )
-            except RuntimeError as ex:
-                if "AlreadyExists" in str(ex):
-                    logger.info(
-                        f"{SUBSTEP_INDENT}Artifact '{artifact_name}' already exists."
-                    )
-                else:
-                    logger.error(f"Error creating artifact '{artifact_name}': {ex}")
+            artifact_yamls.append(artifact_yaml)
+            other_nodes = info["nodes"][1:]
+            if other_nodes:
+                logger.info(
+                    f"{SUBSTEP_INDENT}Using same artifact for nodes: {', '.join(other_nodes)}"
+                )
+
+        if not artifact_yamls:
+            return
+        # Apply all artifacts in a single batch; AlreadyExists is handled
+        # per resource inside the batch apply.
+        try:
+            apply_manifests_batch(artifact_yamls, namespace="eda-system")
+        except RuntimeError as ex:
+            logger.error(f"Error creating artifacts: {ex}")
 
     def commit_transaction(self, description: str):
         """Commit a transaction"""
         return self.eda_client.commit_transaction(description)
 
+    def _flush_transactions_if_needed(self, description: str):
+        """Commit pending transaction items early once the batch grows too large."""
+        if len(self.eda_client.transactions) >= MAX_TRANSACTION_ITEMS:
+            self.commit_transaction(f"{description} (partial batch)")
+
+    def _add_and_validate(self, resource_yamls, error_msg: str, description: str):
+        """
+        Add resources to the transaction and validate them concurrently.
+
+        Resources are processed in chunks of MAX_TRANSACTION_ITEMS so the
+        pending transaction stays bounded; each chunk is validated in one
+        concurrent sweep instead of one round-trip per item.
+
+        Parameters
+        ----------
+        resource_yamls : list
+            The resource YAML strings to add.
+        error_msg : str
+            Message for the ClabConnectorError raised on validation failure.
+        description : str
+            Transaction description used for early flushes.
+
+        Raises
+        ------
+        ClabConnectorError
+            If any resource fails validation.
+        """
+        for i in range(0, len(resource_yamls), MAX_TRANSACTION_ITEMS):
+            chunk = resource_yamls[i : i + MAX_TRANSACTION_ITEMS]
+            items = [self.eda_client.add_replace_to_transaction(y) for y in chunk]
+            if not self.eda_client.validate_transaction_items(items):
+                raise ClabConnectorError(error_msg)
+            self._flush_transactions_if_needed(description)
+
     def create_init(self):
         """
         Create an Init resource in the namespace to bootstrap additional resources.
@@ -277,16 +412,8 @@ class TopologyIntegrator:
         """
         data = {"namespace": self.topology.namespace}
         yaml_str = helpers.render_template("nodesecurityprofile.yaml.j2", data)
-        try:
-            apply_manifest(yaml_str, namespace=self.topology.namespace)
-            logger.info(f"{SUBSTEP_INDENT}Node security profile created.")
-        except RuntimeError as ex:
-            if "AlreadyExists" in str(ex):
-                logger.info(
-                    f"{SUBSTEP_INDENT}Node security profile already exists, skipping."
-                )
-            else:
-                raise
+        # AlreadyExists is handled per resource inside the batch apply.
+        apply_manifests_batch([yaml_str], namespace=self.topology.namespace)
 
     def create_node_user_groups(self):
         """
@@ -354,96 +481,64 @@ class TopologyIntegrator:
         """
         Create NodeProfile resources for each EDA-supported node version-kind combo.
         """
-        profiles = self.topology.get_node_profiles()
-        for prof_yaml in profiles:
-            item = self.eda_client.add_replace_to_transaction(prof_yaml)
-            if not self.eda_client.is_transaction_item_valid(item):
-                raise ClabConnectorError("Validation error creating node profile")
+        self._add_and_validate(
+            self._node_profile_yamls,
+            "Validation error creating node profile",
+            "create node profiles",
+        )
 
     def create_toponodes(self):
-        """Create TopoNode resources for each node in batches."""
+        """Create TopoNode resources for each node."""
 
-        tnodes = self.topology.get_toponodes()
+        tnodes = self._toponode_yamls
         if not tnodes:
             logger.info(f"{SUBSTEP_INDENT}No TopoNodes to create")
             return
 
-        # Process nodes in smaller batches
-        batch_size = 3  # Process 3 nodes at a time
-        batch_delay = 2  # Wait 2 seconds between batches
-
-        logger.info(
-            f"{SUBSTEP_INDENT}Creating {len(tnodes)} TopoNodes in batches of {batch_size}"
+        # The YAMLs are rendered during _precompute; the user-facing
+        # per-node lines belong to this phase, so emit them here.
+        for name in self._toponode_names:
+            logger.info("%sCreating toponode for %s", SUBSTEP_INDENT, name)
+        self._add_and_validate(
+            tnodes,
+            "Validation error creating toponode",
+            "create toponodes",
         )
 
-        for i in range(0, len(tnodes), batch_size):
-            batch = tnodes[i : i + batch_size]
-            batch_num = (i // batch_size) + 1
-            total_batches = (len(tnodes) + batch_size - 1) // batch_size
-
-            logger.info(
-                f"{SUBSTEP_INDENT}Processing batch {batch_num}/{total_batches} ({len(batch)} nodes)..."
-            )
-
-            # Clear any existing transactions for this batch
-            if hasattr(self.eda_client, "transactions"):
-                self.eda_client.transactions = []
-
-            # Add nodes in this batch to transaction
-            for node_yaml in batch:
-                item = self.eda_client.add_replace_to_transaction(node_yaml)
-                if not self.eda_client.is_transaction_item_valid(item):
-                    raise ClabConnectorError("Validation error creating toponode")
-
-            # Commit this batch
-            try:
-                self.commit_transaction(f"create nodes batch {batch_num}")
-                logger.info(
-                    f"{SUBSTEP_INDENT}Batch {batch_num}/{total_batches} committed successfully"
-                )
-            except Exception as e:
-                logger.error(f"Failed to commit batch {batch_num}/{total_batches}: {e}")
-                raise
-
-            # Wait between batches (except for the last batch)
-            if i + batch_size < len(tnodes):
-                logger.debug(
-                    f"{SUBSTEP_INDENT}Waiting {batch_delay}s before next batch..."
-                )
-                time.sleep(batch_delay)
-
-    def create_topolink_interfaces(
-        self,
-        skip_edge_intfs: bool = False,
-        edge_encapsulation: str | None = None,
-        isl_encapsulation: str | None = None,
-    ):
+    def create_topolink_interfaces(self):
         """
         Create Interface resources for each link endpoint in the topology.
         """
-        interfaces = self.topology.get_topolink_interfaces(
-            skip_edge_link_interfaces=skip_edge_intfs,
-            edge_encapsulation=edge_encapsulation,
-            isl_encapsulation=isl_encapsulation,
+        self._add_and_validate(
+            self._topolink_if_yamls,
+            "Validation error creating topolink interface",
+            "create topolink interfaces",
         )
-        for intf_yaml in interfaces:
-            item = self.eda_client.add_replace_to_transaction(intf_yaml)
-            if not self.eda_client.is_transaction_item_valid(item):
-                raise ClabConnectorError("Validation error creating topolink interface")
 
-    def create_topolinks(self, skip_edge_links: bool = False):
-        """Create TopoLink resources for each EDA-supported link in the topology.
+    def create_topolinks(self):
+        """Create TopoLink resources for each EDA-supported link in the topology."""
+        self._add_and_validate(
+            self._topolink_yamls,
+            "Validation error creating topolink",
+            "create topolinks",
+        )
 
-        Parameters
-        ----------
-        skip_edge_links : bool, optional
-            When True, omit TopoLink resources for edge links. Defaults to False.
+    def remove_stale_resources(self):
+        """
+        Add delete items for resources that disappeared from the topology
+        since the last integration.
         """
-        links = self.topology.get_topolinks(skip_edge_links=skip_edge_links)
-        for l_yaml in links:
-            item = self.eda_client.add_replace_to_transaction(l_yaml)
-            if not self.eda_client.is_transaction_item_valid(item):
-                raise ClabConnectorError("Validation error creating topolink")
+        ns = self.topology.namespace
+        for name in sorted(self.delta.removed_links):
+            logger.info("%sRemoving stale TopoLink %s", SUBSTEP_INDENT, name)
+            self.eda_client.add_delete_to_transaction(
+                namespace=ns, kind="TopoLink", name=name
+            )
+        for name in sorted(self.delta.removed_nodes):
+            logger.info("%sRemoving stale TopoNode %s", SUBSTEP_INDENT, name)
+            self.eda_client.add_delete_to_transaction(
+                namespace=ns, kind="TopoNode", name=name
+            )
 
     def run_sros_post_integration(self, node, namespace, normalized_version, quiet):
         """Run SROS post-integration"""
@@ -474,56 +569,73 @@ class TopologyIntegrator:
             quiet=quiet,
         )
 
+    def _run_node_post_integration(self, node, namespace, quiet):
+        """
+        Run post-integration for a single node, logging any failure.
+        """
+        if node.kind in {"nokia_sros", "nokia_srsim"}:
+            logger.info(
+                f"{SUBSTEP_INDENT}Running SROS post-integration for node {node.name} kind {node.kind}"
+            )
+            try:
+                # Get normalized version from the node
+                normalized_version = node._normalize_version(node.version)
+                success = self.run_sros_post_integration(
+                    node, namespace, normalized_version, quiet
+                )
+                if success:
+                    logger.info(
+                        f"{SUBSTEP_INDENT}SROS post-integration for {node.name} completed successfully"
+                    )
+                else:
+                    logger.error(f"SROS post-integration for {node.name} failed")
+            except Exception as e:
+                logger.error(f"Error during SROS post-integration for {node.name}: {e}")
+        elif node.kind in {"arista_ceos"}:
+            logger.info(
+                f"{SUBSTEP_INDENT}Running cEOS post-integration for node {node.name} kind {node.kind}"
+            )
+            try:
+                # Get normalized version from the node
+                normalized_version = node._normalize_version(node.version)
+                success = self.run_ceos_post_integration(
+                    node, namespace, normalized_version, quiet
+                )
+                if success:
+                    logger.info(
+                        f"{SUBSTEP_INDENT}cEOS post-integration for {node.name} completed successfully"
+                    )
+                else:
+                    logger.error(f"cEOS post-integration for {node.name} failed")
+            except Exception as e:
+                logger.error(f"Error during cEOS post-integration for {node.name}: {e}")
+
     def run_post_integration(self):
         """
         Run any post-integration steps required for specific node types.
+
+        Post-integration work is I/O-bound (SSH and kubectl), so nodes are
+        processed concurrently. Failures are logged per node and do not
+        abort the other nodes.
         """
+        post_nodes = self._post_nodes
+        if not post_nodes:
+            return
+
         namespace = self.topology.namespace
-        # Determine if we should be quiet based on the current log level
+        # Quiet mode is a per-run invariant; resolve it once, not per node
         quiet = logging.getLogger().getEffectiveLevel() > logging.INFO
 
-        # Look for SROS nodes and run post-integration for them
-        for node in self.topology.nodes:
-            if node.kind in {"nokia_sros", "nokia_srsim"}:
-                logger.info(
-                    f"{SUBSTEP_INDENT}Running SROS post-integration for node {node.name} kind {node.kind}"
-                )
-                try:
-                    # Get normalized version from the node
-                    normalized_version = node._normalize_version(node.version)
-                    success = self.run_sros_post_integration(
-                        node, namespace, normalized_version, quiet
-                    )
-                    if success:
-                        logger.info(
-                            f"{SUBSTEP_INDENT}SROS post-integration for {node.name} completed successfully"
-                        )
-                    else:
-                        logger.error(f"SROS post-integration for {node.name} failed")
-                except Exception as e:
-                    logger.error(
-                        f"Error during SROS post-integration for {node.name}: {e}"
-                    )
-            elif node.kind in {"arista_ceos"}:
-                logger.info(
-                    f"{SUBSTEP_INDENT}Running cEOS post-integration for node {node.name} kind {node.kind}"
+        max_workers = min(len(post_nodes), POST_INTEGRATION_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(
+                executor.map(
+                    lambda node: self._run_node_post_integration(
+                        node, namespace, quiet
+                    ),
+                    post_nodes,
                 )
-                try:
-                    # Get normalized version from the node
-                    normalized_version = node._normalize_version(node.version)
-                    success = self.run_ceos_post_integration(
-                        node, namespace, normalized_version, quiet
-                    )
-                    if success:
-                        logger.info(
-                            f"{SUBSTEP_INDENT}cEOS post-integration for {node.name} completed successfully"
-                        )
-                    else:
-                        logger.error(f"cEOS post-integration for {node.name} failed")
-                except Exception as e:
-                    logger.error(
-                        f"Error during cEOS post-integration for {node.name}: {e}"
-                    )
+            )
 
     def check_node_synchronization(self):
         """Check that all nodes are properly synchronized in EDA (simplified, no retries)"""
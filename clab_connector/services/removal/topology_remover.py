@@ -4,6 +4,7 @@ import logging
 
 from clab_connector.clients.eda.client import EDAClient
 from clab_connector.models.topology import parse_topology_file
+from clab_connector.services.integration.snapshot import TopologySnapshot
 from clab_connector.utils.constants import SUBSTEP_INDENT
 
 logger = logging.getLogger(__name__)
@@ -46,6 +47,9 @@ class TopologyRemover:
         self.remove_namespace()
         self.eda_client.commit_transaction("remove namespace")
 
+        # Drop the incremental-integration snapshot along with the namespace
+        TopologySnapshot(self.topology.namespace).delete()
+
         logger.info("Done!")
 
     def remove_namespace(self):
@@ -244,7 +244,7 @@ class NodeSyncChecker:
 
         # Check if we have data
         if not data:
-            logger.debug(f"No data available for node {node_name}")
+            logger.debug("No data available for node %s", node_name)
             return NodeStatus(
                 name=node_name,
                 status=NodeSyncStatus.UNKNOWN,
@@ -259,7 +259,7 @@ class NodeSyncChecker:
         # Check TopoNode status based on the schema you provided
         node_status_data = data.get("status", {})
         if node_status_data:
-            logger.debug(f"Status data for {node_name}: {node_status_data}")
+            logger.debug("Status data for %s: %s", node_name, node_status_data)
 
             node_state = node_status_data.get("node-state")
             npp_state = node_status_data.get("npp-state")
@@ -277,7 +277,7 @@ class NodeSyncChecker:
             connectivity_status = npp_state
             config_status = node_state
         else:
-            logger.debug(f"No status data found for node {node_name}")
+            logger.debug("No status data found for node %s", node_name)
 
         # Check spec for additional status info if we still don't have status
         if status == NodeSyncStatus.UNKNOWN and data.get("spec"):
@@ -2,6 +2,7 @@
 
 import logging
 import os
+from functools import lru_cache
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
@@ -10,8 +11,14 @@ logger = logging.getLogger(__name__)
 PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 TEMPLATE_DIR = os.path.join(PACKAGE_ROOT, "templates")
 
+# Single shared environment: templates are compiled once and kept in the
+# environment's cache for the lifetime of the process. The bundled
+# templates never change at runtime, so auto-reload stat calls are skipped.
 template_environment = Environment(
-    loader=FileSystemLoader(TEMPLATE_DIR), autoescape=select_autoescape()
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    autoescape=select_autoescape(),
+    cache_size=-1,
+    auto_reload=False,
 )
 
 
@@ -35,6 +42,34 @@ def render_template(template_name: str, data: dict) -> str:
     return template.render(data)
 
 
+@lru_cache(maxsize=512)
+def _render_template_from_items(template_name: str, data_items: tuple) -> str:
+    return render_template(template_name, dict(data_items))
+
+
+def render_template_cached(template_name: str, data: dict) -> str:
+    """
+    Render a Jinja2 template, memoizing the result.
+
+    Intended for renders that repeat with identical data, such as node
+    profiles shared by every node of the same kind and version. All values
+    in ``data`` must be hashable.
+
+    Parameters
+    ----------
+    template_name : str
+        The name of the template file (e.g., "node-profile.j2").
+    data : dict
+        A dictionary of values to substitute into the template.
+
+    Returns
+    -------
+    str
+        The rendered template as a string.
+    """
+    return _render_template_from_items(template_name, tuple(sorted(data.items())))
+
+
 def normalize_name(name: str) -> str:
     """
     Convert a name to a normalized, EDA-safe format.